@@ -2,6 +2,7 @@
 """
 ASCII Rotating Earth Globe
 Displays a detailed rotating Earth rendered in ASCII characters with a space background.
+Requires NumPy.
 """
 
 import curses
@@ -10,6 +11,13 @@ import time
 import random
 import sys
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:   # optional: fall back to the NumPy renderer
+    njit = None
+
 # ── Earth texture ──────────────────────────────────────────────────────────────
 # 36 rows × 72 columns mapping latitude/longitude to terrain type.
 # Each character encodes:
@@ -108,13 +116,48 @@ for i in range(EARTH_ROWS):
 EARTH_MAP = _rows   # list of 36 strings, each 72 chars
 
 
-def sample_earth(lat_deg: float, lon_deg: float) -> str:
-    """Return the map character for a given latitude/longitude in degrees."""
-    row = int((90.0 - lat_deg) / 180.0 * EARTH_ROWS)
-    col = int((lon_deg + 180.0) / 360.0 * EARTH_COLS)
-    row = max(0, min(EARTH_ROWS - 1, row))
-    col = col % EARTH_COLS
-    return EARTH_MAP[row][col]
+# The same texture as a (rows, cols) array of codepoints for vectorised lookup
+EARTH_TEX = np.array([[ord(c) for c in row] for row in EARTH_MAP],
+                     dtype=np.uint8)
+
+
+# Degrees → texture rows / columns, premultiplied so lookups only multiply
+LAT_TO_ROW = EARTH_ROWS / 180.0
+LON_TO_COL = EARTH_COLS / 360.0
+
+
+def sample_earth(lat_deg, lon_deg, out=None, tmp=None, row=None, col=None):
+    """
+    Return the map codepoints for latitude/longitude in degrees.
+
+    Accepts scalars or arrays.  Array callers may pass out (uint8) and the
+    scratch buffers tmp (float), row and col (int32), shaped like the
+    inputs, so the lookup allocates nothing.
+    """
+    lat_deg = np.asarray(lat_deg)
+    lon_deg = np.asarray(lon_deg)
+    shape = np.broadcast_shapes(lat_deg.shape, lon_deg.shape)
+    if tmp is None:
+        tmp = np.empty(shape, np.result_type(lat_deg, lon_deg, np.float32))
+    if row is None:
+        row = np.empty(shape, np.int32)
+    if col is None:
+        col = np.empty(shape, np.int32)
+    if out is None:
+        out = np.empty(shape, np.uint8)
+
+    np.subtract(90.0, lat_deg, out=tmp)
+    tmp *= LAT_TO_ROW
+    np.copyto(row, tmp, casting='unsafe')
+    np.clip(row, 0, EARTH_ROWS - 1, out=row)
+    np.add(lon_deg, 180.0, out=tmp)
+    tmp *= LON_TO_COL
+    np.copyto(col, tmp, casting='unsafe')
+    np.remainder(col, EARTH_COLS, out=col)
+    row *= EARTH_COLS
+    row += col
+    np.take(EARTH_TEX.ravel(), row, out=out)
+    return out[()] if out.ndim == 0 else out
 
 
 # ── Rendering helpers ──────────────────────────────────────────────────────────
@@ -122,131 +165,374 @@ def sample_earth(lat_deg: float, lon_deg: float) -> str:
 # ASCII shading palette from dark→bright (used for lighting the globe)
 SHADING = " .,:;+*?%#@"
 
-def terrain_shade(char: str, brightness: float) -> str:
-    """Map a terrain char + brightness [0,1] to an ASCII shade character."""
-    if char in (' ', '~'):
-        # Ocean: use blue-ish shading characters
-        shades = " ·.~≈~.·"
-        idx = int(brightness * (len(shades) - 1))
-        return shades[max(0, min(len(shades) - 1, idx))]
-    else:
-        # Land: use denser characters
-        shades = ".,:;oO0#@"
-        idx = int(brightness * (len(shades) - 1))
-        return shades[max(0, min(len(shades) - 1, idx))]
+# Globe shading palettes from dark→bright.  Rendered globe pixels are stored
+# as 1-based indices into GLOBE_GLYPHS, with 0 meaning "no globe here".
+OCEAN_SHADES = " ·.~≈~.·"
+LAND_SHADES = ".,:;oO0#@"
+GLOBE_GLYPHS = OCEAN_SHADES + LAND_SHADES
+# Code → character table used to turn a code buffer into characters
+GLOBE_GLYPH_LUT = np.array([' '] + list(GLOBE_GLYPHS), dtype='U1')
+# Per-palette shade index → GLOBE_GLYPHS code
+OCEAN_SHADE_CODES = np.arange(1, 1 + len(OCEAN_SHADES), dtype=np.uint8)
+LAND_SHADE_CODES = np.arange(1 + len(OCEAN_SHADES), 1 + len(GLOBE_GLYPHS),
+                             dtype=np.uint8)
+
+
+# Terrain class per ASCII codepoint: ocean (for colour and specular),
+# water shading (' ' and '~' only) and mountains
+IS_OCEAN_LUT = np.zeros(128, np.bool_)
+IS_OCEAN_LUT[[ord(' '), ord('~'), ord('.')]] = True
+IS_WATER_SHADE_LUT = np.zeros(128, np.bool_)
+IS_WATER_SHADE_LUT[[ord(' '), ord('~')]] = True
+IS_MOUNTAIN_LUT = np.zeros(128, np.bool_)
+IS_MOUNTAIN_LUT[[ord('^'), ord('#')]] = True
 
 
-def is_ocean(char: str) -> bool:
-    return char in (' ', '~', '.')
+# ── Globe projection ───────────────────────────────────────────────────────────
 
+# Terminal cells are roughly twice as tall as wide → scale y by 0.5
+ASPECT = 0.5
 
-# ── Globe projection ───────────────────────────────────────────────────────────
+# Sun direction (fixed light source, slightly above-right), normalised
+_SUN_RAW = (0.6, -0.4, 0.7)
+_SUN_LEN = math.sqrt(sum(v * v for v in _SUN_RAW))
+SUN = tuple(v / _SUN_LEN for v in _SUN_RAW)
 
-def render_globe(cx: float, cy: float, radius: float,
-                 rotation: float, screen_rows: int, screen_cols: int):
+
+class _GlobeGeometry:
     """
-    Return a list of (row, col, char, color_pair) tuples for every pixel of
-    the globe that falls within the screen.
+    Rotation-independent lookup tables for one screen geometry.
 
-    cx, cy    – centre of globe in screen coordinates
-    radius    – radius in character-cells (we compensate for aspect ratio)
-    rotation  – longitude offset in radians (increases over time)
+    lat_row[py] is the latitude of screen row py and lon_base[py, px] the
+    longitude of pixel (py, px) before rotation (NaN outside the disk), so a
+    frame only has to offset longitude and read the tables back.
     """
-    pixels = []
-    # Sun direction (fixed light source, slightly above-right)
-    sun = (0.6, -0.4, 0.7)
-    sun_len = math.sqrt(sum(v * v for v in sun))
-    sun = tuple(v / sun_len for v in sun)
-
-    # Terminal cells are roughly twice as tall as wide → scale y by 0.5
-    ASPECT = 0.5
-
-    for py in range(screen_rows):
-        dy = (py - cy) / (radius * ASPECT)   # normalise to [-1,1] range
-        if abs(dy) > 1.0:
-            continue
-        for px in range(screen_cols):
-            dx = (px - cx) / radius
-            d2 = dx * dx + dy * dy
-            if d2 > 1.0:
-                continue
-            # Surface normal in 3-D (sphere of unit radius)
-            dz = math.sqrt(max(0.0, 1.0 - d2))
-            nx, ny, nz = dx, dy, dz
-
-            # Convert normal back to lat/lon, then apply rotation
-            lat = math.degrees(math.asin(max(-1.0, min(1.0, -ny))))
-            lon = math.degrees(math.atan2(nx, nz)) + math.degrees(rotation)
-            lon = ((lon + 180.0) % 360.0) - 180.0
-
-            terrain = sample_earth(lat, lon)
-
-            # Diffuse lighting (Lambertian)
-            dot = nx * sun[0] + ny * sun[1] + nz * sun[2]
-            brightness = max(0.05, dot)  # small ambient keeps dark side visible
-
-            # Specular highlight on ocean
-            if is_ocean(terrain):
-                spec = max(0.0, dot) ** 8
-                brightness = min(1.0, brightness + 0.3 * spec)
-
-            ch = terrain_shade(terrain, brightness)
-
-            # Colour pair selection
-            if is_ocean(terrain):
-                if brightness > 0.7:
-                    color = 5   # bright ocean (cyan-ish)
+
+    def __init__(self, cx, cy, radius, screen_rows, screen_cols):
+        # Evaluate the projection for the whole screen grid at once
+        px = np.arange(screen_cols)
+        py = np.arange(screen_rows)
+        dy_row = (py - cy) / (radius * ASPECT)   # normalise to [-1,1] range
+        dx = (px - cx) / radius
+        dy = dy_row[:, None]
+        d2 = dx * dx + dy * dy
+        self.mask = d2 <= 1.0
+        dy, dx = np.broadcast_arrays(dy, dx)
+
+        # Surface normal in 3-D (sphere of unit radius)
+        nx, ny, nz = dx[self.mask], dy[self.mask], np.sqrt(1.0 - d2[self.mask])
+
+        # Latitude only depends on the row; longitude is rotated per frame
+        self.lat_row = np.degrees(
+            np.arcsin(np.clip(-dy_row, -1.0, 1.0))).astype(np.float32)
+        self.lon_base = np.full((screen_rows, screen_cols), np.nan, np.float32)
+        self.lon_base[self.mask] = np.degrees(np.arctan2(nx, nz))
+
+        # The same tables gathered over the disk, in row-major pixel order
+        self.lat = self.lat_row[np.nonzero(self.mask)[0]]
+        self.lon = self.lon_base[self.mask]
+
+        # Diffuse lighting (Lambertian)
+        self.dot = nx * SUN[0] + ny * SUN[1] + nz * SUN[2]
+        # small ambient keeps dark side visible
+        self.brightness = np.maximum(self.dot, 0.05)
+        # Lit ocean adds a specular highlight (dot**8 as three squarings);
+        # which pixels are ocean changes with rotation, the values do not
+        self.lit = self.dot > 0
+        self.night = self.dot < 0
+        spec = self.dot * self.dot
+        spec *= spec
+        spec *= spec
+        spec *= 0.3
+        spec += self.brightness
+        self.ocean_brightness = np.minimum(spec, 1.0, out=spec)
+
+        # Output buffers, reused by every frame rendered at this geometry
+        self.codes = np.empty(len(self.dot), np.uint8)
+        self.colors = np.empty(len(self.dot), np.int8)
+        self.code_buf = np.zeros((screen_rows, screen_cols), np.uint8)
+        self.char_buf = np.empty((screen_rows, screen_cols), 'U1')
+        self.color_buf = np.full((screen_rows, screen_cols), -1, np.int8)
+
+
+# Globe pixels shaded per block by the NumPy renderer; at 32×32 one block's
+# scratch buffers total about 38 KB, on the order of an L1 data cache.
+TILE_SIZE = 32 * 32
+
+
+class _GlobeScratch:
+    """Scratch buffers shared by every block of every NumPy-rendered frame."""
+
+    def __init__(self, size):
+        self.lon = np.empty(size, np.float32)
+        self.tmp = np.empty(size, np.float32)
+        self.row = np.empty(size, np.int32)
+        self.col = np.empty(size, np.int32)
+        self.terrain = np.empty(size, np.uint8)
+        self.ocean = np.empty(size, np.bool_)
+        self.mountain = np.empty(size, np.bool_)
+        self.ocean_shade = np.empty(size, np.bool_)
+        self.code = np.empty(size, np.uint8)
+        self.sel = np.empty(size, np.bool_)
+        self.brightness = np.empty(size)
+        self.scaled = np.empty(size)
+
+
+_scratch = _GlobeScratch(TILE_SIZE)
+
+# Only the geometry of the current frame is kept
+_globe_cache = {}
+
+
+def _globe_geometry(cx: float, cy: float, radius: float,
+                    screen_rows: int, screen_cols: int) -> _GlobeGeometry:
+    """Return the cached geometry, rebuilding it when the layout changes."""
+    key = (screen_rows, screen_cols, cx, cy, radius)
+    geometry = _globe_cache.get(key)
+    if geometry is None:
+        geometry = _GlobeGeometry(cx, cy, radius, screen_rows, screen_cols)
+        _globe_cache.clear()
+        _globe_cache[key] = geometry
+    return geometry
+
+
+def _make_renderer(sun):
+    """
+    Build the Numba kernel for a fixed sun direction.
+
+    The sun components are closure variables, so Numba compiles them in as
+    constants; the geometry is passed as the reciprocals 1/radius and
+    1/(radius*ASPECT) so the projection is multiplies only.  The kernel
+    fills GLOBE_GLYPHS codes and colour pairs (-1 = none) into code_out /
+    color_out.
+    """
+    sx, sy, sz = sun
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def render(cx, cy, inv_r, inv_r_aspect, rot_deg, earth_tex,
+               is_ocean_lut, is_water_shade_lut, is_mountain_lut,
+               code_out, color_out):
+        rows, cols = code_out.shape
+        n_ocean = len(OCEAN_SHADES)
+        n_land = len(LAND_SHADES)
+        for py in prange(rows):
+            dy = (py - cy) * inv_r_aspect
+            for px in range(cols):
+                dx = (px - cx) * inv_r
+                d2 = dx * dx + dy * dy
+                if d2 > 1.0:
+                    code_out[py, px] = 0
+                    color_out[py, px] = -1
+                    continue
+                dz = math.sqrt(max(0.0, 1.0 - d2))
+
+                lat = math.degrees(math.asin(max(-1.0, min(1.0, -dy))))
+                lon = math.degrees(math.atan2(dx, dz)) + rot_deg
+                lon = ((lon + 180.0) % 360.0) - 180.0
+
+                row = int((90.0 - lat) * LAT_TO_ROW)
+                col = int((lon + 180.0) * LON_TO_COL)
+                row = max(0, min(EARTH_ROWS - 1, row))
+                terrain = earth_tex[row, col % EARTH_COLS]
+                ocean = is_ocean_lut[terrain]
+
+                dot = dx * sx + dy * sy + dz * sz
+                brightness = max(0.05, dot)
+                if ocean and dot > 0:
+                    spec = dot * dot
+                    spec *= spec
+                    spec *= spec
+                    brightness = min(1.0, brightness + 0.3 * spec)
+
+                if is_water_shade_lut[terrain]:
+                    idx = int(brightness * (n_ocean - 1))
+                    code_out[py, px] = 1 + max(0, min(n_ocean - 1, idx))
                 else:
-                    color = 3   # dark ocean (blue)
-            else:
-                if terrain in ('^', '#'):
-                    color = 6   # mountains (white/grey)
+                    idx = int(brightness * (n_land - 1))
+                    code_out[py, px] = (1 + n_ocean
+                                        + max(0, min(n_land - 1, idx)))
+
+                if dot < 0:
+                    color = 7
+                elif ocean:
+                    color = 5 if brightness > 0.7 else 3
+                elif is_mountain_lut[terrain]:
+                    color = 6
                 elif brightness > 0.6:
-                    color = 4   # bright land (green)
+                    color = 4
                 else:
-                    color = 2   # dark land (darker green)
+                    color = 2
+                color_out[py, px] = color
+
+    return render
+
+
+if njit is not None:
+    _render_globe_nb = _make_renderer(SUN)
+
 
-            # Night side tint
-            if dot < 0:
-                color = 7   # very dim blue for night side
+def render_globe(cx: float, cy: float, radius: float,
+                 rotation: float, screen_rows: int, screen_cols: int):
+    """
+    Render the globe into (char_buf, color_buf), two (rows, cols) arrays of
+    characters and int8 colour pairs; color_buf is -1 where the globe does
+    not cover the screen.  The buffers are reused by the next call, so
+    consume them before rendering again.
 
-            pixels.append((py, px, ch, color))
-    return pixels
+    cx, cy    – centre of globe in screen coordinates
+    radius    – radius in character-cells (we compensate for aspect ratio)
+    rotation  – longitude offset in radians (increases over time)
+    """
+    geometry = _globe_geometry(cx, cy, radius, screen_rows, screen_cols)
+    code_buf, color_buf = geometry.code_buf, geometry.color_buf
+
+    if njit is not None:
+        _render_globe_nb(cx, cy, 1.0 / radius, 1.0 / (radius * ASPECT),
+                         math.degrees(rotation), EARTH_TEX,
+                         IS_OCEAN_LUT, IS_WATER_SHADE_LUT, IS_MOUNTAIN_LUT,
+                         code_buf, color_buf)
+        np.take(GLOBE_GLYPH_LUT, code_buf, out=geometry.char_buf)
+        return geometry.char_buf, color_buf
+
+    # Wrap before adding to the float32 tables so precision does not decay
+    # as the rotation keeps growing
+    rot_deg = math.degrees(rotation) % 360.0
+    for start in range(0, len(geometry.dot), TILE_SIZE):
+        _shade_block(geometry, _scratch, rot_deg,
+                     start, min(start + TILE_SIZE, len(geometry.dot)))
+
+    code_buf[geometry.mask] = geometry.codes
+    color_buf[geometry.mask] = geometry.colors
+    np.take(GLOBE_GLYPH_LUT, code_buf, out=geometry.char_buf)
+    return geometry.char_buf, color_buf
+
+
+def _shade_index(brightness, length, tmp, out):
+    """Vectorised palette index int(brightness * (length - 1)), clamped."""
+    np.multiply(brightness, length - 1, out=tmp)
+    np.copyto(out, tmp, casting='unsafe')
+    np.clip(out, 0, length - 1, out=out)
+
+
+def _shade_block(geometry, scratch, rot_deg, start, stop):
+    """Shade disk pixels [start, stop) into geometry.codes / geometry.colors."""
+    n = stop - start
+    lat = geometry.lat[start:stop]
+    lon = scratch.lon[:n]
+    tmp = scratch.tmp[:n]
+    row = scratch.row[:n]
+    col = scratch.col[:n]
+    terrain = scratch.terrain[:n]
+    ocean_mask = scratch.ocean[:n]
+    mountain_mask = scratch.mountain[:n]
+    ocean_shade = scratch.ocean_shade[:n]
+    code = scratch.code[:n]
+    sel = scratch.sel[:n]
+    brightness = scratch.brightness[:n]
+    scaled = scratch.scaled[:n]
+    colors = geometry.colors[start:stop]
+
+    # Read the tables back and wrap longitude into [-180, 180)
+    np.add(geometry.lon[start:stop], rot_deg, out=lon)
+    lon += 180.0
+    np.remainder(lon, 360.0, out=lon)
+    lon -= 180.0
+
+    sample_earth(lat, lon, out=terrain, tmp=tmp, row=row, col=col)
+
+    # Shading treats only ' ' / '~' as water; colouring also counts '.'
+    np.take(IS_OCEAN_LUT, terrain, out=ocean_mask)
+    np.take(IS_WATER_SHADE_LUT, terrain, out=ocean_shade)
+    np.take(IS_MOUNTAIN_LUT, terrain, out=mountain_mask)
+
+    # Specular highlight on lit ocean, from the per-geometry table
+    brightness[:] = geometry.brightness[start:stop]
+    np.logical_and(geometry.lit[start:stop], ocean_mask, out=sel)
+    np.copyto(brightness, geometry.ocean_brightness[start:stop], where=sel)
+
+    # Shade characters: index each palette by brightness, pick per pixel
+    codes = geometry.codes[start:stop]
+    _shade_index(brightness, len(LAND_SHADES), scaled, row)
+    np.take(LAND_SHADE_CODES, row, out=codes)
+    _shade_index(brightness, len(OCEAN_SHADES), scaled, row)
+    np.take(OCEAN_SHADE_CODES, row, out=code)
+    np.copyto(codes, code, where=ocean_shade)
+
+    # Colour pair selection: bright/dark ocean (5/3), mountains (6),
+    # bright/dark land (4/2), and a dim blue night side (7)
+    colors.fill(2)
+    np.copyto(colors, 4, where=np.greater(brightness, 0.6, out=sel))
+    np.copyto(colors, 6, where=mountain_mask)
+    np.copyto(colors, 3, where=ocean_mask)
+    np.greater(brightness, 0.7, out=sel)
+    sel &= ocean_mask
+    np.copyto(colors, 5, where=sel)
+    np.copyto(colors, 7, where=geometry.night[start:stop])
 
 
 # ── Star / comet / space background ───────────────────────────────────────────
 
-class Star:
-    CHARS = ['·', '✦', '+', '✧', '⋆', '*', '᛫']
+class StarField:
+    """
+    All background stars as parallel NumPy arrays (one slot per star).
 
-    def __init__(self, rows, cols):
-        self.reset(rows, cols, initial=True)
-
-    def reset(self, rows, cols, initial=False):
-        self.row = random.randint(2, rows - 3)
-        self.col = random.randint(0, cols - 1)
-        self.char = random.choice(self.CHARS)
-        self.color = random.choice([8, 9, 10])   # dim white / dim cyan / dim yellow
-        self.twinkle_phase = random.uniform(0, math.pi * 2)
-        self.twinkle_speed = random.uniform(0.5, 2.0)
+    Dead stars are respawned in place, so the field always holds `count`
+    stars and a frame costs a handful of array operations regardless of N.
+    """
+    CHARS = np.array(['·', '✦', '+', '✧', '⋆', '*', '᛫'])
+    COLORS = np.array([8, 9, 10])   # dim white / dim cyan / dim yellow
+    # Twinkle gate sin(phase) > -0.5, tabulated over 256 phase steps
+    TWINKLE_STEPS = 256
+    TWINKLE_LUT = np.sin(np.linspace(0, 2 * math.pi, TWINKLE_STEPS,
+                                     endpoint=False)) > -0.5
+
+    def __init__(self, count, rows, cols):
+        self.rng = np.random.default_rng()
+        self.row = np.empty(count, np.int32)
+        self.col = np.empty(count, np.int32)
+        self.char_idx = np.empty(count, np.int32)
+        self.color = np.empty(count, np.int32)
+        self.twinkle_phase = np.empty(count)
+        self.twinkle_speed = np.empty(count)
+        self.age = np.empty(count)
+        self.max_age = np.empty(count)
+        self.reset(np.ones(count, np.bool_), rows, cols, initial=True)
+
+    def reset(self, which, rows, cols, initial=False):
+        """Respawn the stars selected by the boolean mask `which`."""
+        n = int(np.count_nonzero(which))
+        rng = self.rng
+        self.row[which] = rng.integers(2, rows - 2, n)
+        self.col[which] = rng.integers(0, cols, n)
+        self.char_idx[which] = rng.integers(0, len(self.CHARS), n)
+        self.color[which] = rng.choice(self.COLORS, n)
+        self.twinkle_phase[which] = rng.uniform(0, math.pi * 2, n)
+        self.twinkle_speed[which] = rng.uniform(0.5, 2.0, n)
         if initial:
-            self.age = random.uniform(0, 100)
+            self.age[which] = rng.uniform(0, 100, n)
         else:
-            self.age = 0
-        self.max_age = random.uniform(60, 200)
+            self.age[which] = 0
+        self.max_age[which] = rng.uniform(60, 200, n)
 
-    def update(self, dt):
+    def update(self, dt, rows, cols):
         self.age += dt * 10
-
-    def is_dead(self):
-        return self.age > self.max_age
+        dead = self.age > self.max_age
+        if dead.any():
+            # Replacements get a random age too, keeping respawns staggered
+            self.reset(dead, rows, cols, initial=True)
 
     def visible(self, t):
-        # Twinkle: sine wave gating
-        return math.sin(t * self.twinkle_speed + self.twinkle_phase) > -0.5
+        # Twinkle: sine wave gating, read from the quantised phase table
+        phase = t * self.twinkle_speed + self.twinkle_phase
+        phase *= self.TWINKLE_STEPS / (2 * math.pi)
+        idx = phase.astype(np.int64)
+        idx &= self.TWINKLE_STEPS - 1
+        return self.TWINKLE_LUT[idx]
 
 
 class Comet:
+    TAIL_CHARS = ['·', '·', '.', '.', ' ']
+
     def __init__(self, rows, cols):
         self.rows = rows
         self.cols = cols
@@ -272,14 +558,26 @@ class Comet:
         self.dr = math.sin(angle) * speed
         self.dc = math.cos(angle) * speed
         self.tail_len = random.randint(4, 10)
-        self.trail = []   # list of (row, col) past positions
+        # Ring buffer of past (row, col) positions; trail[head] is the slot
+        # written next and `count` how many slots hold positions
+        self.trail = np.empty((self.tail_len, 2), np.float32)
+        self.head = 0
+        self.count = 0
         self.alive = True
         self.color = random.choice([11, 12, 13])   # bright white / cyan / yellow
 
+        # Glyph and dim factor per cell, head first then tail by age
+        fades = np.arange(1, self.tail_len + 1) / (self.tail_len + 1)
+        tail_idx = np.minimum((fades * len(self.TAIL_CHARS)).astype(np.int32),
+                              len(self.TAIL_CHARS) - 1)
+        self.glyphs = np.array(['★'] + [self.TAIL_CHARS[i] for i in tail_idx])
+        self.dims = np.concatenate(([1.0], 1.0 - fades))
+        self._ages = np.arange(self.tail_len)
+
     def update(self, dt):
-        self.trail.append((self.row, self.col))
-        if len(self.trail) > self.tail_len:
-            self.trail.pop(0)
+        self.trail[self.head] = (self.row, self.col)
+        self.head = (self.head + 1) % self.tail_len
+        self.count = min(self.count + 1, self.tail_len)
         self.row += self.dr * dt
         self.col += self.dc * dt
         if (self.row < 2 or self.row >= self.rows - 2
@@ -287,15 +585,14 @@ class Comet:
             self.alive = False
 
     def cells(self):
-        """Yield (row, col, char, color, dim_factor) for head + tail."""
-        # Head
-        yield (int(self.row), int(self.col), '★', self.color, 1.0)
-        # Tail (fading)
-        for i, (tr, tc) in enumerate(reversed(self.trail)):
-            fade = (i + 1) / (self.tail_len + 1)
-            tail_chars = ['·', '·', '.', '.', ' ']
-            ci = min(int(fade * len(tail_chars)), len(tail_chars) - 1)
-            yield (int(tr), int(tc), tail_chars[ci], self.color, 1.0 - fade)
+        """Return (rows, cols, chars, dim_factors) arrays for head + tail."""
+        # Tail slots from newest to oldest
+        tail = self.trail[(self.head - 1 - self._ages[:self.count])
+                          % self.tail_len]
+        rows = np.concatenate(([int(self.row)], tail[:, 0].astype(np.int32)))
+        cols = np.concatenate(([int(self.col)], tail[:, 1].astype(np.int32)))
+        n = self.count + 1
+        return rows, cols, self.glyphs[:n], self.dims[:n]
 
 
 class Planet:
@@ -328,6 +625,74 @@ class Planet:
                 or self.col < 0 or self.col >= cols)
 
 
+# ── Frame buffer ───────────────────────────────────────────────────────────────
+
+class FrameBuffer:
+    """
+    Double-buffered character / attribute grid for the space scene.
+
+    Each frame is composed into chars / attrs, then flush() sends only the
+    cells that differ from the previous frame and swaps the buffers, so the
+    screen is never erased and redrawn wholesale.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.chars = np.full((rows, cols), ' ', 'U1')
+        self.attrs = np.zeros((rows, cols), np.int64)
+        self.prev_chars = self.chars.copy()
+        self.prev_attrs = self.attrs.copy()
+
+    def clear(self):
+        self.chars.fill(' ')
+        self.attrs.fill(0)
+
+    def put(self, row, col, char, attr):
+        self.chars[row, col] = char
+        self.attrs[row, col] = attr
+
+    def flush(self, win):
+        """
+        Draw the cells changed since the last flush, then swap buffers.
+
+        Each row is split wherever the attribute or the changed state flips,
+        and every changed segment is emitted as one string.
+        """
+        changed = ((self.chars != self.prev_chars)
+                   | (self.attrs != self.prev_attrs))
+        for r in np.flatnonzero(changed.any(axis=1)).tolist():
+            changed_row = changed[r]
+            attr_row = self.attrs[r]
+            bounds = (np.flatnonzero((np.diff(attr_row) != 0)
+                                     | (np.diff(changed_row) != 0))
+                      + 1).tolist()
+            starts = [0] + bounds
+            ends = bounds + [self.cols]
+            row_chars = self.chars[r].tolist()
+            for start, end, dirty, attr in zip(
+                    starts, ends, changed_row[starts].tolist(),
+                    attr_row[starts].tolist()):
+                if not dirty:
+                    continue
+                try:
+                    win.addstr(r, start, "".join(row_chars[start:end]), attr)
+                except curses.error:
+                    pass
+        self.chars, self.prev_chars = self.prev_chars, self.chars
+        self.attrs, self.prev_attrs = self.prev_attrs, self.attrs
+
+
+def draw_globe(frame, chars, colors, attrs):
+    """Composite render_globe output into frame; attrs maps colour → attr."""
+    rows, cols = frame.rows, frame.cols
+    area = (slice(2, rows - 2), slice(0, cols - 1))
+    colors = colors[area]
+    globe = colors >= 0
+    frame.chars[area][globe] = chars[area][globe]
+    frame.attrs[area][globe] = attrs[colors[globe]]
+
+
 # ── Banner helpers ─────────────────────────────────────────────────────────────
 
 def draw_banner(win, row: int, cols: int, text: str, color: int):
@@ -372,18 +737,38 @@ def init_colors():
     curses.init_pair(18, curses.COLOR_BLACK,   curses.COLOR_GREEN)   # Built with Coder!
 
 
+NUM_COLOR_PAIRS = 19
+
+
+def color_attrs():
+    """
+    Return (bold, dim): int64 arrays mapping a colour pair index to
+    color_pair(i) | A_BOLD and color_pair(i) | A_DIM.  Call after
+    init_colors(); the draw paths index these instead of calling
+    curses.color_pair per cell.
+    """
+    pairs = np.array([curses.color_pair(i) for i in range(NUM_COLOR_PAIRS)],
+                     dtype=np.int64)
+    return pairs | curses.A_BOLD, pairs | curses.A_DIM
+
+
 def main(stdscr):
     curses.curs_set(0)
     stdscr.nodelay(True)
     stdscr.timeout(33)   # ~30 fps
 
     init_colors()
+    attr_bold, attr_dim = color_attrs()
+    # Choose bold for lit globe areas, dim for night
+    globe_attrs = attr_bold.copy()
+    globe_attrs[7] = attr_dim[7]
 
     rows, cols = stdscr.getmaxyx()
+    frame = FrameBuffer(rows, cols)
 
     # ── Space objects ──
     NUM_STARS = max(30, (rows * cols) // 80)
-    stars = [Star(rows, cols) for _ in range(NUM_STARS)]
+    stars = StarField(NUM_STARS, rows, cols)
     comets = []
     planets = []
 
@@ -393,6 +778,7 @@ def main(stdscr):
     ROTATION_PERIOD = 60.0   # seconds per full rotation
     start_time = time.monotonic()
     last_time = start_time
+    globe_key = None   # (rotation step, rows, cols) of the cached globe
 
     while True:
         now = time.monotonic()
@@ -407,6 +793,9 @@ def main(stdscr):
 
         # ── Recompute layout (terminal may resize) ──
         rows, cols = stdscr.getmaxyx()
+        if (rows, cols) != (frame.rows, frame.cols):
+            frame = FrameBuffer(rows, cols)
+            stdscr.erase()
         cx = cols / 2.0
         cy = rows / 2.0
         # Radius: fill most of the shorter dimension, leave room for banners
@@ -415,14 +804,15 @@ def main(stdscr):
         radius = max(4.0, radius)
 
         rotation = (elapsed / ROTATION_PERIOD) * 2.0 * math.pi
+        # The globe is re-rendered in whole steps of one texture column, or
+        # of one screen cell at the centre of the disk if that is finer;
+        # frames in between reuse the previous render.
+        rotation_step = min(2.0 * math.pi / EARTH_COLS, 1.0 / radius)
+        rotation_bucket = int(rotation / rotation_step)
 
         # ── Update space objects ──
         # Stars
-        for s in stars:
-            s.update(dt)
-        stars = [s for s in stars if not s.is_dead()]
-        while len(stars) < NUM_STARS:
-            stars.append(Star(rows, cols))
+        stars.update(dt, rows, cols)
 
         # Comets
         comet_timer -= dt
@@ -443,54 +833,37 @@ def main(stdscr):
         planets = [p for p in planets if not p.is_dead(rows, cols)]
 
         # ── Build frame ──
-        stdscr.erase()
+        frame.clear()
 
         # 1. Stars (draw first, behind everything)
-        for s in stars:
-            if 2 <= s.row < rows - 2 and 0 <= s.col < cols - 1:
-                if s.visible(elapsed):
-                    try:
-                        attr = curses.color_pair(s.color) | curses.A_DIM
-                        stdscr.addstr(s.row, s.col, s.char, attr)
-                    except curses.error:
-                        pass
+        shown = (stars.visible(elapsed) & (stars.row >= 2)
+                 & (stars.row < rows - 2) & (stars.col < cols - 1))
+        star_rows, star_cols = stars.row[shown], stars.col[shown]
+        frame.chars[star_rows, star_cols] = stars.CHARS[stars.char_idx[shown]]
+        frame.attrs[star_rows, star_cols] = attr_dim[stars.color[shown]]
 
         # 2. Planets (subtle, behind comets and globe)
         for p in planets:
             if 2 <= p.row < rows - 2 and 0 <= p.col < cols - 1:
-                try:
-                    attr = curses.color_pair(p.color) | curses.A_DIM
-                    stdscr.addstr(p.row, p.col, p.glyph, attr)
-                except curses.error:
-                    pass
+                frame.put(p.row, p.col, p.glyph, attr_dim[p.color])
 
         # 3. Comets
         for c in comets:
-            for cr, cc, ch, ccol, fade in c.cells():
-                if 2 <= cr < rows - 2 and 0 <= cc < cols - 1:
-                    try:
-                        attr = curses.color_pair(ccol)
-                        if fade < 0.5:
-                            attr |= curses.A_DIM
-                        else:
-                            attr |= curses.A_BOLD
-                        stdscr.addstr(cr, cc, ch, attr)
-                    except curses.error:
-                        pass
+            cr, cc, ch, fade = c.cells()
+            keep = (cr >= 2) & (cr < rows - 2) & (cc >= 0) & (cc < cols - 1)
+            frame.chars[cr[keep], cc[keep]] = ch[keep]
+            frame.attrs[cr[keep], cc[keep]] = np.where(
+                fade[keep] < 0.5, attr_dim[c.color], attr_bold[c.color])
 
         # 4. Globe (rendered over the background)
-        globe_pixels = render_globe(cx, cy, radius, rotation, rows, cols)
-        for pr, pc, ch, color in globe_pixels:
-            if 2 <= pr < rows - 2 and 0 <= pc < cols - 1:
-                try:
-                    # Choose bold for lit areas, dim for night
-                    if color == 7:
-                        attr = curses.color_pair(color) | curses.A_DIM
-                    else:
-                        attr = curses.color_pair(color) | curses.A_BOLD
-                    stdscr.addstr(pr, pc, ch, attr)
-                except curses.error:
-                    pass
+        if (rotation_bucket, rows, cols) != globe_key:
+            globe_key = (rotation_bucket, rows, cols)
+            globe_chars, globe_colors = render_globe(
+                cx, cy, radius, rotation_bucket * rotation_step, rows, cols)
+        draw_globe(frame, globe_chars, globe_colors, globe_attrs)
+
+        # Send only the cells that changed since the previous frame
+        frame.flush(stdscr)
 
         # 5. Banners (drawn last so they are always on top)
         draw_banner(stdscr, 0,        cols, "✦  Hello World!  ✦",    17)